@@ -48,6 +48,10 @@ def OvnProviderAgent(exit_event):
     ovn_nb_idl_for_events.notify_handler.watch_events(events)
     c = connection.Connection(ovn_nb_idl_for_events,
                               ovn_conf.get_ovn_ovsdb_timeout())
+    # NOTE: the NB connection must be established before OvnSbIdlForLb
+    # is constructed: check_and_set_ssl_files() writes the process-global
+    # Stream SSL settings, so constructing the SB IDL first would make
+    # the NB connect run with the SB certificates.
     c.start()
 
     ovn_sb_idl_for_events = impl_idl_ovn.OvnSbIdlForLb(
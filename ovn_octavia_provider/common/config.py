@@ -19,6 +19,7 @@ from ovn_octavia_provider.i18n import _
 
 LOG = logging.getLogger(__name__)
 
+OVSDB_PROBE_INTERVAL_DEFAULT = 60000
 
 ovn_opts = [
     cfg.ListOpt('ovn_nb_connection',
@@ -73,7 +74,7 @@ ovn_opts = [
                       'each retry to get the OVN NB and SB IDLs')),
     cfg.IntOpt('ovsdb_probe_interval',
                min=0,
-               default=60000,
+               default=OVSDB_PROBE_INTERVAL_DEFAULT,
                help=_('The probe interval in for the OVSDB session in '
                       'milliseconds. If this is zero, it disables the '
                       'connection keepalive feature. If non-zero the value '
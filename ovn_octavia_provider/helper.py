@@ -3592,6 +3592,7 @@ class OvnProviderHelper():
                 ovn_lb.external_ids.get(ovn_const.OVN_MEMBER_STATUS_KEY, '{}')
             )
 
+            mappings_to_del = []
             for (mb_ip, mb_port, mb_subnet, mb_id) in members_try_remove:
                 delete = True
                 for member_id in [item[3] for item in other_members
@@ -3602,8 +3603,13 @@ class OvnProviderHelper():
                         delete = False
 
                 if delete:
-                    self.ovn_nbdb_api.lb_del_ip_port_mapping(
-                        ovn_lb.uuid, mb_ip).execute()
+                    mappings_to_del.append(mb_ip)
+
+            if mappings_to_del:
+                # Remove all the backends in a single command so only one
+                # transaction is committed on the NB socket.
+                self.ovn_nbdb_api.lb_bulk_update_ip_port_mapping(
+                    ovn_lb.uuid, dels=mappings_to_del).execute()
 
     def _update_hm_member(self, ovn_lb, pool_key, backend_ip, delete=False):
         # Update just the backend_ip member
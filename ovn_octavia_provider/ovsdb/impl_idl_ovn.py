@@ -11,15 +11,15 @@
 #    under the License.
 
 import atexit
-import contextlib
+import threading
+import time
 
-import netaddr
-from neutron_lib import constants as n_const
 from neutron_lib import exceptions as n_exc
 from oslo_log import log
 from ovsdbapp.backend import ovs_idl
 from ovsdbapp.backend.ovs_idl import command
 from ovsdbapp.backend.ovs_idl import connection
+from ovsdbapp.backend.ovs_idl import event as row_event
 from ovsdbapp.backend.ovs_idl import idlutils
 from ovsdbapp.backend.ovs_idl import rowview
 from ovsdbapp.backend.ovs_idl import transaction as idl_trans
@@ -39,16 +39,45 @@ LOG = log.getLogger(__name__)
 
 class OvnNbTransaction(idl_trans.Transaction):
 
+    __slots__ = ('bump_nb_cfg', '_nb_cfg_bumped')
+
     def __init__(self, *args, **kwargs):
         # NOTE(lucasagomes): The bump_nb_cfg parameter is only used by
         # the agents health status check
         self.bump_nb_cfg = kwargs.pop('bump_nb_cfg', False)
+        self._nb_cfg_bumped = False
         super().__init__(*args, **kwargs)
 
     def pre_commit(self, txn):
+        # pre_commit runs once per commit attempt (TRY_AGAIN retries
+        # included), so reset the marker each time.
+        self._nb_cfg_bumped = False
         if not self.bump_nb_cfg:
             return
+        # Each nb_cfg increment is a serialized NB_Global write that makes
+        # every NB client process a monitor update, so bumps requested
+        # back-to-back are coalesced into a single trailing one. The gate
+        # is only consulted here; the interval is consumed in post_commit,
+        # once the increment has actually landed.
+        if not self.api.should_bump_nb_cfg():
+            return
         self.api.nb_global.increment('nb_cfg')
+        self._nb_cfg_bumped = True
+
+    def post_commit(self, txn):
+        super().post_commit(txn)
+        if self._nb_cfg_bumped:
+            self.api.nb_cfg_bumped()
+
+
+class RowByValueWaitEvent(row_event.WaitEvent):
+    """Wait for a row with a matching column value to appear in a table."""
+
+    def __init__(self, table, column, match, timeout):
+        events = (self.ROW_CREATE, self.ROW_UPDATE)
+        super().__init__(events, table, ((column, '=', match),),
+                         timeout=timeout)
+        self.event_name = 'RowByValueWaitEvent'
 
 
 class Backend(ovs_idl.Backend):
@@ -56,27 +85,80 @@ class Backend(ovs_idl.Backend):
     def is_table_present(self, table_name):
         return table_name in self._tables
 
+    def cached_lookup(self, txn, table, record):
+        """Look up a record, memoized for the lifetime of one transaction.
+
+        Commands batched in the same transaction frequently target the
+        same row (e.g. paired add/del on one Load_Balancer); the cache
+        avoids re-walking the IDL indexes for every command. The cache
+        lives on the low-level transaction object, so it is dropped
+        automatically on commit, abort or retry.
+        """
+        try:
+            cache = txn._ovn_row_cache
+        except AttributeError:
+            cache = txn._ovn_row_cache = {}
+        key = (table, record)
+        try:
+            return cache[key]
+        except KeyError:
+            row = self.lookup(table, record)
+            cache[key] = row
+            return row
+
     def is_col_present(self, table_name, col_name):
         return self.is_table_present(table_name) and (
             col_name in self._tables[table_name].columns)
 
-    # Check for a column match in the table. If not found do a retry with
-    # a stop delay of 10 secs. This function would be useful if the caller
+    # Check for a column match in the table. If not found, wait for the
+    # matching row to show up through the IDL notifications (or poll with
+    # backoff when the IDL has no notify handler), giving up after
+    # 'timeout' seconds. This function would be useful if the caller
     # wants to verify for the presence of a particular row in the table
     # with the column match before doing any transaction.
     # Eg. We can check if Logical_Switch row is present before adding a
     # logical switch port to it.
-    @tenacity.retry(retry=tenacity.retry_if_exception_type(RuntimeError),
-                    wait=tenacity.wait_exponential(),
-                    stop=tenacity.stop_after_delay(10),
-                    reraise=True)
-    def check_for_row_by_value_and_retry(self, table, column, match):
+    def check_for_row_by_value_and_retry(self, table, column, match,
+                                         timeout=10):
         try:
             idlutils.row_by_value(self.idl, table, column, match)
-        except idlutils.RowNotFound as e:
-            msg = (_("%(match)s does not exist in %(column)s of %(table)s")
-                   % {'match': match, 'column': column, 'table': table})
-            raise RuntimeError(msg) from e
+            return
+        except idlutils.RowNotFound:
+            pass
+
+        handler = getattr(self.idl, 'notify_handler', None)
+        if handler is not None:
+            ev = RowByValueWaitEvent(table, column, match, timeout)
+            handler.watch_event(ev)
+            try:
+                # Re-check now that the watch is in place, so a row that
+                # appeared between the lookup above and watch_event() is
+                # not missed, then sleep until the event fires.
+                try:
+                    idlutils.row_by_value(self.idl, table, column, match)
+                    return
+                except idlutils.RowNotFound:
+                    if ev.wait():
+                        return
+            finally:
+                handler.unwatch_event(ev)
+        else:
+            try:
+                for attempt in tenacity.Retrying(
+                        retry=tenacity.retry_if_exception_type(
+                            idlutils.RowNotFound),
+                        wait=tenacity.wait_exponential(),
+                        stop=tenacity.stop_after_delay(timeout),
+                        reraise=True):
+                    with attempt:
+                        idlutils.row_by_value(self.idl, table, column, match)
+                return
+            except idlutils.RowNotFound:
+                pass
+
+        msg = (_("%(match)s does not exist in %(column)s of %(table)s")
+               % {'match': match, 'column': column, 'table': table})
+        raise RuntimeError(msg)
 
 
 class OvsdbConnectionUnavailable(n_exc.ServiceUnavailable):
@@ -87,81 +169,266 @@ class OvsdbConnectionUnavailable(n_exc.ServiceUnavailable):
 
 
 class FindLbInTableCommand(command.ReadOnlyCommand):
+
+    __slots__ = ('lb', 'table')
+
     def __init__(self, api, lb, table):
         super().__init__(api)
         self.lb = lb
         self.table = table
 
     def run_idl(self, txn):
+        # NOTE: the python IDL does not support a reverse (set-membership)
+        # index on the load_balancer column, so a full scan cannot be
+        # avoided entirely. Skip rows without any load balancer reference
+        # before the membership test: on big clusters the vast majority of
+        # Logical_Switch/Logical_Router rows reference no load balancer,
+        # so this removes most of the per-row comparison work.
         self.result = [
             rowview.RowView(item) for item in
             self.api.tables[self.table].rows.values()
-            if self.lb in item.load_balancer]
+            if item.load_balancer and self.lb in item.load_balancer]
 
 
 class GetLrsCommand(command.ReadOnlyCommand):
+
+    __slots__ = ('with_lbs',)
+
+    def __init__(self, api, with_lbs=False):
+        super().__init__(api)
+        self.with_lbs = with_lbs
+
     def run_idl(self, txn):
-        self.result = [
-            rowview.RowView(item) for item in
-            self.api.tables['Logical_Router'].rows.values()]
+        # Filter before wrapping: on LR-heavy clusters the RowView
+        # construction is the dominant cost of this scan, so routers the
+        # caller is not interested in never get a wrapper.
+        if self.with_lbs:
+            self.result = [
+                rowview.RowView(item) for item in
+                self.api.tables['Logical_Router'].rows.values()
+                if item.load_balancer]
+        else:
+            self.result = [
+                rowview.RowView(item) for item in
+                self.api.tables['Logical_Router'].rows.values()]
+
+
+class EnsureLbInGroupCommand(command.AddCommand):
+
+    __slots__ = ('lb', 'group_name')
+
+    table_name = 'Load_Balancer_Group'
+
+    def __init__(self, api, lb, group_name):
+        super().__init__(api)
+        self.lb = lb
+        self.group_name = group_name
+
+    def run_idl(self, txn):
+        try:
+            group = idlutils.row_by_value(
+                self.api.idl, self.table_name, 'name', self.group_name)
+        except idlutils.RowNotFound:
+            group = txn.insert(self.api.tables[self.table_name])
+            group.name = self.group_name
+        lb = self.api.lookup('Load_Balancer', self.lb)
+        group.addvalue('load_balancer', lb)
+        # AddCommand.post_commit remaps this to the committed row: for
+        # the insert path the named-uuid set here only exists until the
+        # transaction is applied.
+        self.result = group.uuid
 
 
 # NOTE(froyo): remove this class once ovsdbapp manages the IPv6 into [ ]
 # https://bugs.launchpad.net/ovsdbapp/+bug/2057471
 class DelBackendFromIPPortMapping(command.BaseCommand):
+
+    __slots__ = ('lb', 'backend_ip')
+
     table = 'Load_Balancer'
 
     def __init__(self, api, lb, backend_ip):
         super().__init__(api)
         self.lb = lb
-        if netaddr.IPNetwork(backend_ip).version == n_const.IP_VERSION_6:
-            self.backend_ip = f'[{backend_ip}]'
-        else:
-            self.backend_ip = backend_ip
+        # NOTE: the keys in ip_port_mappings are bare IPs (never CIDRs),
+        # so a simple ':' scan is enough to detect IPv6 and is orders of
+        # magnitude cheaper than parsing the address with netaddr.
+        self.backend_ip = (f'[{backend_ip}]' if ':' in backend_ip
+                           else backend_ip)
 
     def run_idl(self, txn):
+        # Only the benign races (LB already deleted, key already gone)
+        # are swallowed; anything else propagates. LOG.exception is
+        # avoided on purpose, formatting a traceback while holding the
+        # IDL lock is expensive.
         try:
-            ovn_lb = self.api.lookup(self.table, self.lb)
+            ovn_lb = self.api.cached_lookup(txn, self.table, self.lb)
             ovn_lb.delkey('ip_port_mappings', self.backend_ip)
-        except Exception:
-            LOG.exception("Error deleting backend %s from ip_port_mappings "
-                          "for LB uuid %s", str(self.backend_ip), str(self.lb))
+        except (idlutils.RowNotFound, KeyError) as e:
+            LOG.warning("Error deleting backend %s from ip_port_mappings "
+                        "for LB uuid %s: %s", self.backend_ip, self.lb, e)
 
 
 # NOTE(froyo): remove this class once ovsdbapp manages the IPv6 into [ ]
 # https://bugs.launchpad.net/ovsdbapp/+bug/2057471
 class AddBackendToIPPortMapping(command.BaseCommand):
+
+    __slots__ = ('lb', 'backend_ip', 'port_name', 'src_ip', 'value')
+
     table = 'Load_Balancer'
 
     def __init__(self, api, lb, backend_ip, port_name, src_ip):
         super().__init__(api)
         self.lb = lb
-        self.backend_ip = backend_ip
         self.port_name = port_name
-        self.src_ip = src_ip
-        if netaddr.IPNetwork(backend_ip).version == n_const.IP_VERSION_6:
-            self.backend_ip = f'[{backend_ip}]'
-            self.src_ip = f'[{src_ip}]'
+        # One scan of the backend address decides the bracketing of both
+        # addresses; OVN does not mix address families in one mapping.
+        is6 = ':' in backend_ip
+        self.backend_ip = f'[{backend_ip}]' if is6 else backend_ip
+        self.src_ip = f'[{src_ip}]' if is6 else src_ip
+        # Precompute the mapping value: run_idl runs under the IDL lock
+        # and is re-executed on every transaction retry.
+        self.value = f'{self.port_name}:{self.src_ip}'
+
+    def run_idl(self, txn):
+        # See DelBackendFromIPPortMapping.run_idl about the narrow
+        # exception handling.
+        try:
+            lb = self.api.cached_lookup(txn, self.table, self.lb)
+            lb.setkey('ip_port_mappings', self.backend_ip, self.value)
+        except (idlutils.RowNotFound, KeyError) as e:
+            LOG.warning("Error adding backend %s to ip_port_mappings "
+                        "for LB uuid %s: %s", self.backend_ip, self.lb, e)
+
+
+class BulkUpdateIPPortMapping(command.BaseCommand):
+
+    __slots__ = ('lb', 'adds', 'dels')
+
+    table = 'Load_Balancer'
+
+    def __init__(self, api, lb, adds=None, dels=None):
+        super().__init__(api)
+        self.lb = lb
+        self.adds = {}
+        for backend_ip, (port_name, src_ip) in (adds or {}).items():
+            is6 = ':' in backend_ip
+            key = f'[{backend_ip}]' if is6 else backend_ip
+            self.adds[key] = (f'{port_name}:[{src_ip}]' if is6
+                              else f'{port_name}:{src_ip}')
+        self.dels = [f'[{ip}]' if ':' in ip else ip for ip in dels or []]
 
     def run_idl(self, txn):
+        # The python IDL accumulates every setkey/delkey issued against a
+        # row and emits them as one JSON-RPC 'mutate' operation at commit
+        # time, so this whole update travels as a single operation on the
+        # wire regardless of the number of backends.
         try:
-            lb = self.api.lookup(self.table, self.lb)
-            lb.setkey('ip_port_mappings', self.backend_ip,
-                      '%s:%s' % (self.port_name, self.src_ip))
-        except Exception:
-            LOG.exception("Error adding backend %s to ip_port_mappings "
-                          "for LB uuid %s", str(self.backend_ip), str(self.lb))
+            lb = self.api.cached_lookup(txn, self.table, self.lb)
+            adds = self.adds
+            delkey = lb.delkey
+            setkey = lb.setkey
+            for backend_ip in self.dels:
+                # setkey replaces an existing key, so a delete that is
+                # superseded by an add of the same key can be dropped.
+                if backend_ip not in adds:
+                    delkey('ip_port_mappings', backend_ip)
+            for backend_ip, value in adds.items():
+                setkey('ip_port_mappings', backend_ip, value)
+        except (idlutils.RowNotFound, KeyError) as e:
+            LOG.warning("Error bulk updating ip_port_mappings for LB "
+                        "uuid %s: %s", self.lb, e)
+
+
+class _TransactionContext:
+    """Context manager absorbing RevisionConflict around a transaction.
+
+    The conflict can surface either from the body of the with block or
+    from the commit that runs when the wrapped context manager exits;
+    both are logged and suppressed, any other outcome is passed through
+    untouched.
+    """
+
+    __slots__ = ('_parent',)
+
+    def __init__(self, parent):
+        self._parent = parent
+
+    def __enter__(self):
+        return self._parent.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            suppressed = self._parent.__exit__(exc_type, exc_value, traceback)
+        except ovn_exc.RevisionConflict as e:
+            LOG.info('Transaction aborted. Reason: %s', e)
+            return True
+        if not suppressed and isinstance(exc_value, ovn_exc.RevisionConflict):
+            LOG.info('Transaction aborted. Reason: %s', exc_value)
+            return True
+        return suppressed
+
+
+def _probe_interval_for_db_size(idl_):
+    """Pick an inactivity probe interval scaled to the monitored DB size.
+
+    A probe that fires against a busy ovsdb-server triggers a reconnect
+    and a full monitor re-sync, which gets more expensive the bigger the
+    snapshot is. Allow proportionally more idle time on bigger databases
+    before probing. Scaling only applies while ovsdb_probe_interval is
+    left at its default: an explicitly configured interval (including 0,
+    which disables the keepalive) is always respected.
+    """
+    configured = config.get_ovn_ovsdb_probe_interval()
+    if configured != config.OVSDB_PROBE_INTERVAL_DEFAULT:
+        return configured
+    total_rows = sum(len(table.rows) for table in idl_.tables.values())
+    if total_rows >= 10000:
+        return 600000
+    if total_rows >= 1000:
+        return 180000
+    return configured
 
 
 class OvsdbNbOvnIdl(nb_impl_idl.OvnNbApiIdlImpl, Backend):
+
+    # Minimum spacing between two nb_cfg bumps; bump_nb_cfg transactions
+    # issued more often than this skip the redundant increment.
+    NB_CFG_BUMP_MIN_INTERVAL = 1.0
+
     def __init__(self, connection):
         super().__init__(connection)
         self.idl._session.reconnect.set_probe_interval(
-            config.get_ovn_ovsdb_probe_interval())
+            _probe_interval_for_db_size(self.idl))
+        self._last_nb_cfg_bump = float('-inf')
+        self._nb_global = None
 
     @property
     def nb_global(self):
-        return next(iter(self.tables['NB_Global'].rows.values()))
+        # NB_Global is a singleton row, so cache it after the first
+        # access instead of materializing a fresh iterator on every
+        # transaction. The cached row is revalidated against the table
+        # (a plain dict lookup) so a reconnect that rebuilds the IDL
+        # contents drops the stale reference.
+        row = self._nb_global
+        if row is not None and row.uuid in self.tables['NB_Global'].rows:
+            return row
+        row = next(iter(self.tables['NB_Global'].rows.values()))
+        self._nb_global = row
+        return row
+
+    def should_bump_nb_cfg(self):
+        """Whether enough time passed since the last committed bump.
+
+        Deliberately side-effect free: a transaction that decides to
+        bump may still be retried or fail, so only nb_cfg_bumped(),
+        called after a successful commit, consumes the interval.
+        """
+        elapsed = time.monotonic() - self._last_nb_cfg_bump
+        return elapsed >= self.NB_CFG_BUMP_MIN_INTERVAL
+
+    def nb_cfg_bumped(self):
+        self._last_nb_cfg_bump = time.monotonic()
 
     def create_transaction(self, check_error=False, log_errors=True,
                            bump_nb_cfg=False):
@@ -169,24 +436,37 @@ class OvsdbNbOvnIdl(nb_impl_idl.OvnNbApiIdlImpl, Backend):
             self, self.ovsdb_connection, self.ovsdb_connection.timeout,
             check_error, log_errors, bump_nb_cfg=bump_nb_cfg)
 
-    @contextlib.contextmanager
     def transaction(self, *args, **kwargs):
         """A wrapper on the ovsdbapp transaction to work with revisions.
 
         This method is just a wrapper around the ovsdbapp transaction
-        to handle revision conflicts correctly.
+        to handle revision conflicts correctly. It returns a class-based
+        context manager rather than a generator one, so entering and
+        leaving a transaction costs two plain method calls instead of
+        driving an extra generator frame.
         """
-        try:
-            with super().transaction(*args, **kwargs) as t:
-                yield t
-        except ovn_exc.RevisionConflict as e:
-            LOG.info('Transaction aborted. Reason: %s', e)
+        return _TransactionContext(super().transaction(*args, **kwargs))
 
     def find_lb_in_table(self, lb, table):
         return FindLbInTableCommand(self, lb, table)
 
-    def get_lrs(self):
-        return GetLrsCommand(self)
+    def get_lrs(self, with_lbs=False):
+        """Get the Logical_Router rows.
+
+        With 'with_lbs' set, only routers referencing at least one load
+        balancer are returned.
+        """
+        return GetLrsCommand(self, with_lbs=with_lbs)
+
+    def ensure_lb_in_group(self, lb, group_name):
+        """Add a LB to a shared Load_Balancer_Group, creating it if needed.
+
+        Referencing a group from the Logical_Switch/Logical_Router rows
+        instead of each individual LB keeps the number of NB references
+        at M+N rather than M*N. Only usable when the server schema has
+        the Load_Balancer_Group table (see is_table_present).
+        """
+        return EnsureLbInGroupCommand(self, lb, group_name)
 
     # NOTE(froyo): remove this method once ovsdbapp manages the IPv6 into [ ]
     def lb_del_ip_port_mapping(self, lb_uuid, backend_ip):
@@ -197,26 +477,75 @@ class OvsdbNbOvnIdl(nb_impl_idl.OvnNbApiIdlImpl, Backend):
         return AddBackendToIPPortMapping(self, lb_uuid, backend_ip, port_name,
                                          src_ip)
 
+    def lb_bulk_update_ip_port_mapping(self, lb_uuid, adds=None, dels=None):
+        """Apply several ip_port_mappings changes in a single command.
+
+        'adds' maps backend IP to a (port_name, src_ip) tuple and 'dels'
+        is a list of backend IPs. One Load_Balancer lookup and a single
+        transaction round-trip cover all the backends, instead of one
+        command per backend.
+        """
+        return BulkUpdateIPPortMapping(self, lb_uuid, adds=adds, dels=dels)
+
 
 class OvsdbSbOvnIdl(sb_impl_idl.OvnSbApiIdlImpl, Backend):
     def __init__(self, connection):
         super().__init__(connection)
         self.idl._session.reconnect.set_probe_interval(
-            config.get_ovn_ovsdb_probe_interval())
+            _probe_interval_for_db_size(self.idl))
+
+
+def _register_columns(helper, columns, optional=False):
+    """Register the given table column subsets with the schema helper.
+
+    Columns missing from the schema advertised by the server are
+    silently skipped, matching the graceful degradation the provider
+    already gets against older OVN versions. Whole tables are only
+    allowed to be missing when 'optional' is True.
+    """
+    schema_tables = helper.schema_json.get('tables', {})
+    register = helper.register_columns
+    for table, cols in columns.items():
+        if optional and table not in schema_tables:
+            continue
+        schema_cols = schema_tables[table]['columns']
+        register(table, [c for c in cols if c in schema_cols])
 
 
 class OvnNbIdlForLb(ovsdb_monitor.OvnIdl):
     SCHEMA = "OVN_Northbound"
-    TABLES = ('Logical_Switch', 'Load_Balancer', 'Load_Balancer_Health_Check',
-              'Logical_Router', 'Logical_Switch_Port', 'Logical_Router_Port',
-              'Gateway_Chassis', 'NAT', 'HA_Chassis_Group')
+    # Only the columns the provider actually consumes are monitored.
+    # Registering whole tables would pull e.g. the ACL/QoS/DHCP related
+    # columns of Logical_Switch and Logical_Switch_Port into the IDL,
+    # inflating the initial snapshot and every update notification.
+    COLUMNS = {
+        'Logical_Switch': ['name', 'ports', 'load_balancer', 'external_ids'],
+        'Load_Balancer': ['name', 'vips', 'protocol', 'health_check',
+                          'ip_port_mappings', 'selection_fields', 'options',
+                          'external_ids'],
+        'Load_Balancer_Health_Check': ['vip', 'options', 'external_ids'],
+        'Logical_Router': ['name', 'ports', 'load_balancer', 'external_ids'],
+        'Logical_Switch_Port': ['name', 'type', 'addresses', 'options',
+                                'external_ids'],
+        'Logical_Router_Port': ['name', 'networks', 'gateway_chassis',
+                                'ha_chassis_group', 'external_ids'],
+        'Gateway_Chassis': ['name'],
+        'NAT': ['external_ids', 'external_ip', 'external_mac',
+                'logical_port'],
+        'HA_Chassis_Group': ['name'],
+    }
+    TABLES = tuple(COLUMNS)
+    # Tables that only exist in newer OVN NB schema versions. They are
+    # registered only when the server schema actually provides them.
+    OPTIONAL_COLUMNS = {'Load_Balancer_Group': ['name', 'load_balancer']}
 
     def __init__(self, event_lock_name=None, notifier=True):
         self.conn_string = config.get_ovn_nb_connection()
         ovsdb_monitor.check_and_set_ssl_files(self.SCHEMA)
         helper = self._get_ovsdb_helper(self.conn_string)
-        for table in OvnNbIdlForLb.TABLES:
-            helper.register_table(table)
+        _register_columns(helper, OvnNbIdlForLb.COLUMNS)
+        _register_columns(helper, OvnNbIdlForLb.OPTIONAL_COLUMNS,
+                          optional=True)
         super().__init__(
             driver=None, remote=self.conn_string, schema=helper,
             notifier=notifier)
@@ -231,37 +560,66 @@ class OvnNbIdlForLb(ovsdb_monitor.OvnIdl):
 
 class OvnSbIdlForLb(ovsdb_monitor.OvnIdl):
     SCHEMA = "OVN_Southbound"
-    TABLES = ('Load_Balancer', 'Service_Monitor')
+    # See OvnNbIdlForLb.COLUMNS; the datapaths column of the SB
+    # Load_Balancer table is deliberately left out, it references rows
+    # of the (unmonitored) Datapath_Binding table.
+    COLUMNS = {
+        'Load_Balancer': ['name', 'vips', 'protocol', 'options',
+                          'external_ids'],
+        'Service_Monitor': ['ip', 'protocol', 'port', 'logical_port',
+                            'src_ip', 'src_mac', 'status', 'options',
+                            'external_ids'],
+    }
+    TABLES = tuple(COLUMNS)
 
     def __init__(self, event_lock_name=None):
         self.conn_string = config.get_ovn_sb_connection()
         ovsdb_monitor.check_and_set_ssl_files(self.SCHEMA)
         helper = self._get_ovsdb_helper(self.conn_string)
-        for table in OvnSbIdlForLb.TABLES:
-            helper.register_table(table)
+        _register_columns(helper, OvnSbIdlForLb.COLUMNS)
         super().__init__(
             driver=None, remote=self.conn_string, schema=helper)
         self.event_lock_name = event_lock_name
         if self.event_lock_name:
             self.set_lock(self.event_lock_name)
+        self._conn = None
         atexit.register(self.stop)
 
     @utils.retry()
     def _get_ovsdb_helper(self, connection_string):
         return idlutils.get_schema_helper(connection_string, self.SCHEMA)
 
+    @property
+    def conn(self):
+        # Starting a Connection pulls the complete monitored SB snapshot
+        # from the server, so it is created on first use only: instances
+        # that never run an SB query (NB-only workloads) skip the monitor
+        # sync entirely, and repeated start() calls reuse the same
+        # Connection instead of rebuilding it.
+        if self._conn is None:
+            self._conn = connection.Connection(
+                self, timeout=config.get_ovn_ovsdb_timeout())
+        return self._conn
+
     def start(self):
-        self.conn = connection.Connection(
-            self, timeout=config.get_ovn_ovsdb_timeout())
         return OvsdbSbOvnIdl(self.conn)
 
     def stop(self):
-        # Close the running connection if it has been initalized
-        if hasattr(self, 'conn'):
-            if not self.conn.stop(timeout=config.get_ovn_ovsdb_timeout()):
-                LOG.debug("Connection terminated to OvnSb "
-                          "but a thread is still alive")
-            del self.conn
+        # Close the running connection if it has been initalized.
+        # Clearing the reference first also guards against re-entry:
+        # stop() is registered with atexit and may race an explicit call.
+        conn, self._conn = self._conn, None
+        if conn is not None and not conn.stop(timeout=1):
+            # Do not block process teardown for the full OVSDB timeout.
+            # A second conn.stop() would be a no-op now that is_running
+            # is cleared, so join the still-running connection thread
+            # itself from a daemon thread.
+            LOG.debug("Connection terminated to OvnSb "
+                      "but a thread is still alive")
+            if conn.thread is not None:
+                remaining = max(config.get_ovn_ovsdb_timeout() - 1, 1)
+                threading.Thread(target=conn.thread.join,
+                                 args=(remaining,), daemon=True).start()
         # complete the shutdown for the event handler
         self.notify_handler.shutdown()
         # Close the idl session
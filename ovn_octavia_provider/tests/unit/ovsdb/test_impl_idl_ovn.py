@@ -19,8 +19,10 @@ from neutron.tests import base
 from ovs.db import idl as ovs_idl
 from ovsdbapp.backend import ovs_idl as real_ovs_idl
 from ovsdbapp.backend.ovs_idl import idlutils
+from ovsdbapp.backend.ovs_idl import rowview
 
 from ovn_octavia_provider.common import config as ovn_config
+from ovn_octavia_provider.common import exceptions as ovn_exc
 from ovn_octavia_provider.ovsdb import impl_idl_ovn
 
 basedir = os.path.dirname(os.path.abspath(__file__))
@@ -53,6 +55,293 @@ class TestOvnNbIdlForLb(base.BaseTestCase):
             self.idl = impl_idl_ovn.OvnNbIdlForLb(event_lock_name='foo')
         set_lock.assert_called_once_with('foo')
 
+    def test_optional_table_not_in_schema(self):
+        # The test schema predates Load_Balancer_Group, so the optional
+        # table must not have been registered with the schema helper.
+        self.assertNotIn('Load_Balancer_Group', self.idl.tables)
+
+    def test_column_subset_registered(self):
+        ls_columns = self.idl.tables['Logical_Switch'].columns
+        self.assertIn('load_balancer', ls_columns)
+        # Columns the provider never reads must not be monitored.
+        self.assertNotIn('acls', ls_columns)
+
+    def test_column_not_in_schema_skipped(self):
+        # Load_Balancer.options only exists in newer NB schemas; with the
+        # old test schema it must simply not be registered.
+        self.assertNotIn('options', self.idl.tables['Load_Balancer'].columns)
+        self.assertIn('vips', self.idl.tables['Load_Balancer'].columns)
+
+
+class TestProbeIntervalForDbSize(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        ovn_config.register_opts()
+
+    def _idl(self, rows):
+        return mock.Mock(tables={'table': mock.Mock(rows=[None] * rows)})
+
+    def test_default_scales_with_db_size(self):
+        self.assertEqual(
+            60000, impl_idl_ovn._probe_interval_for_db_size(self._idl(10)))
+        self.assertEqual(
+            180000,
+            impl_idl_ovn._probe_interval_for_db_size(self._idl(1500)))
+        self.assertEqual(
+            600000,
+            impl_idl_ovn._probe_interval_for_db_size(self._idl(20000)))
+
+    def test_explicit_interval_respected(self):
+        ovn_config.cfg.CONF.set_override(
+            'ovsdb_probe_interval', 5000, group='ovn')
+        self.assertEqual(
+            5000, impl_idl_ovn._probe_interval_for_db_size(self._idl(20000)))
+
+    def test_disabled_keepalive_respected(self):
+        ovn_config.cfg.CONF.set_override(
+            'ovsdb_probe_interval', 0, group='ovn')
+        self.assertEqual(
+            0, impl_idl_ovn._probe_interval_for_db_size(self._idl(20000)))
+
+
+class TestTransactionContext(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.parent = mock.MagicMock()
+        self.parent.__exit__.return_value = False
+        self.ctx = impl_idl_ovn._TransactionContext(self.parent)
+        self.conflict = ovn_exc.RevisionConflict(
+            resource_id='lb', resource_type='loadbalancer')
+
+    def test_enter_returns_parent_value(self):
+        self.assertEqual(self.parent.__enter__.return_value,
+                         self.ctx.__enter__())
+
+    def test_conflict_raised_by_commit_suppressed(self):
+        # The commit runs inside the wrapped __exit__; a conflict raised
+        # there must be logged and swallowed.
+        self.parent.__exit__.side_effect = self.conflict
+        with mock.patch.object(impl_idl_ovn, 'LOG') as mock_log:
+            with self.ctx:
+                pass
+        mock_log.info.assert_called_once_with(
+            'Transaction aborted. Reason: %s', self.conflict)
+
+    def test_conflict_raised_in_body_suppressed(self):
+        with mock.patch.object(impl_idl_ovn, 'LOG') as mock_log:
+            with self.ctx:
+                raise self.conflict
+        self.parent.__exit__.assert_called_once_with(
+            ovn_exc.RevisionConflict, self.conflict, mock.ANY)
+        mock_log.info.assert_called_once_with(
+            'Transaction aborted. Reason: %s', self.conflict)
+
+    def test_other_exception_propagates(self):
+        error = ValueError('boom')
+
+        def _run():
+            with self.ctx:
+                raise error
+        self.assertRaises(ValueError, _run)
+        self.parent.__exit__.assert_called_once_with(
+            ValueError, error, mock.ANY)
+
+    def test_parent_suppression_honored(self):
+        self.parent.__exit__.return_value = True
+
+        def _run():
+            with self.ctx:
+                raise ValueError('boom')
+        _run()
+
+
+class TestCheckForRowByValueAndRetry(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.backend = impl_idl_ovn.Backend.__new__(impl_idl_ovn.Backend)
+        self.idl = mock.Mock()
+        mock.patch.object(impl_idl_ovn.Backend, 'idl',
+                          new=mock.PropertyMock(
+                              return_value=self.idl)).start()
+        self.handler = self.idl.notify_handler
+
+    @mock.patch.object(idlutils, 'row_by_value')
+    def test_row_already_present(self, mock_rbv):
+        self.backend.check_for_row_by_value_and_retry(
+            'Logical_Switch', 'name', 'net1')
+        self.handler.watch_event.assert_not_called()
+
+    @mock.patch.object(idlutils, 'row_by_value',
+                       side_effect=idlutils.RowNotFound)
+    def test_row_appears_via_event(self, mock_rbv):
+        ev = mock.Mock(**{'wait.return_value': True})
+        with mock.patch.object(impl_idl_ovn, 'RowByValueWaitEvent',
+                               return_value=ev) as mock_ev:
+            self.backend.check_for_row_by_value_and_retry(
+                'Logical_Switch', 'name', 'net1')
+        mock_ev.assert_called_once_with('Logical_Switch', 'name', 'net1', 10)
+        self.handler.watch_event.assert_called_once_with(ev)
+        self.handler.unwatch_event.assert_called_once_with(ev)
+
+    @mock.patch.object(idlutils, 'row_by_value')
+    def test_row_appears_between_lookup_and_watch(self, mock_rbv):
+        # The row shows up after the initial lookup but before the watch
+        # is registered; the re-check must catch it without sleeping.
+        mock_rbv.side_effect = [idlutils.RowNotFound, mock.Mock()]
+        ev = mock.Mock()
+        with mock.patch.object(impl_idl_ovn, 'RowByValueWaitEvent',
+                               return_value=ev):
+            self.backend.check_for_row_by_value_and_retry(
+                'Logical_Switch', 'name', 'net1')
+        ev.wait.assert_not_called()
+        self.handler.unwatch_event.assert_called_once_with(ev)
+
+    @mock.patch.object(idlutils, 'row_by_value',
+                       side_effect=idlutils.RowNotFound)
+    def test_wait_timeout_raises(self, mock_rbv):
+        ev = mock.Mock(**{'wait.return_value': False})
+        with mock.patch.object(impl_idl_ovn, 'RowByValueWaitEvent',
+                               return_value=ev):
+            self.assertRaises(
+                RuntimeError,
+                self.backend.check_for_row_by_value_and_retry,
+                'Logical_Switch', 'name', 'net1')
+        self.handler.unwatch_event.assert_called_once_with(ev)
+
+    @mock.patch.object(idlutils, 'row_by_value',
+                       side_effect=idlutils.RowNotFound)
+    def test_poll_fallback_without_notify_handler(self, mock_rbv):
+        del self.idl.notify_handler
+        self.assertRaises(
+            RuntimeError,
+            self.backend.check_for_row_by_value_and_retry,
+            'Logical_Switch', 'name', 'net1', timeout=0)
+        self.assertTrue(mock_rbv.called)
+
+
+class TestEnsureLbInGroupCommand(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.api = mock.MagicMock()
+        self.txn = mock.MagicMock()
+        self.cmd = impl_idl_ovn.EnsureLbInGroupCommand(
+            self.api, 'lb-uuid', 'lb-group')
+
+    @mock.patch.object(idlutils, 'row_by_value')
+    def test_existing_group(self, mock_rbv):
+        group = mock_rbv.return_value
+        self.cmd.run_idl(self.txn)
+        mock_rbv.assert_called_once_with(
+            self.api.idl, 'Load_Balancer_Group', 'name', 'lb-group')
+        self.txn.insert.assert_not_called()
+        group.addvalue.assert_called_once_with(
+            'load_balancer', self.api.lookup.return_value)
+        self.assertEqual(group.uuid, self.cmd.result)
+
+    @mock.patch.object(idlutils, 'row_by_value',
+                       side_effect=idlutils.RowNotFound)
+    def test_creates_missing_group(self, mock_rbv):
+        group = self.txn.insert.return_value
+        self.cmd.run_idl(self.txn)
+        self.txn.insert.assert_called_once_with(
+            self.api.tables['Load_Balancer_Group'])
+        self.assertEqual('lb-group', group.name)
+        group.addvalue.assert_called_once_with(
+            'load_balancer', self.api.lookup.return_value)
+        self.assertEqual(group.uuid, self.cmd.result)
+
+    def test_post_commit_remaps_insert_uuid(self):
+        real_uuid = mock.Mock()
+        self.cmd.result = 'named-uuid'
+        self.txn.get_insert_uuid.return_value = real_uuid
+        row = self.api.tables['Load_Balancer_Group'].rows[real_uuid]
+        self.cmd.post_commit(self.txn)
+        self.txn.get_insert_uuid.assert_called_once_with('named-uuid')
+        self.assertIsInstance(self.cmd.result, rowview.RowView)
+        self.assertEqual(row, self.cmd.result._row)
+
+
+class TestOvnNbTransaction(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.api = mock.Mock()
+        self.txn = impl_idl_ovn.OvnNbTransaction(
+            self.api, mock.Mock(), 5, bump_nb_cfg=True)
+
+    def test_no_bump_requested(self):
+        self.txn.bump_nb_cfg = False
+        self.txn.pre_commit(mock.Mock())
+        self.api.nb_global.increment.assert_not_called()
+        self.txn.post_commit(mock.Mock())
+        self.api.nb_cfg_bumped.assert_not_called()
+
+    def test_bump_rate_limited(self):
+        self.api.should_bump_nb_cfg.return_value = False
+        self.txn.pre_commit(mock.Mock())
+        self.api.nb_global.increment.assert_not_called()
+        self.txn.post_commit(mock.Mock())
+        self.api.nb_cfg_bumped.assert_not_called()
+
+    def test_bump_recorded_after_commit(self):
+        self.api.should_bump_nb_cfg.return_value = True
+        self.txn.pre_commit(mock.Mock())
+        self.api.nb_global.increment.assert_called_once_with('nb_cfg')
+        self.txn.post_commit(mock.Mock())
+        self.api.nb_cfg_bumped.assert_called_once_with()
+
+    def test_retry_without_final_bump_not_recorded(self):
+        # A TRY_AGAIN retry re-runs pre_commit; only the outcome of the
+        # attempt that actually committed may consume the interval.
+        self.api.should_bump_nb_cfg.side_effect = [True, False]
+        self.txn.pre_commit(mock.Mock())
+        self.txn.pre_commit(mock.Mock())
+        self.txn.post_commit(mock.Mock())
+        self.api.nb_cfg_bumped.assert_not_called()
+
+
+class TestIPPortMappingCommands(base.BaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.api = mock.Mock()
+
+    def test_add_backend_ipv4(self):
+        cmd = impl_idl_ovn.AddBackendToIPPortMapping(
+            self.api, 'lb', '10.0.0.1', 'lsp', '10.0.0.2')
+        self.assertEqual('10.0.0.1', cmd.backend_ip)
+        self.assertEqual('10.0.0.2', cmd.src_ip)
+
+    def test_add_backend_ipv6(self):
+        cmd = impl_idl_ovn.AddBackendToIPPortMapping(
+            self.api, 'lb', '2001:db8::1', 'lsp', '2001:db8::2')
+        self.assertEqual('[2001:db8::1]', cmd.backend_ip)
+        self.assertEqual('[2001:db8::2]', cmd.src_ip)
+
+    def test_del_backend_ipv4(self):
+        cmd = impl_idl_ovn.DelBackendFromIPPortMapping(
+            self.api, 'lb', '10.0.0.1')
+        self.assertEqual('10.0.0.1', cmd.backend_ip)
+
+    def test_del_backend_ipv6(self):
+        cmd = impl_idl_ovn.DelBackendFromIPPortMapping(self.api, 'lb', '::1')
+        self.assertEqual('[::1]', cmd.backend_ip)
+
+    def test_bulk_update_mixed_families(self):
+        cmd = impl_idl_ovn.BulkUpdateIPPortMapping(
+            self.api, 'lb',
+            adds={'10.0.0.1': ('lsp1', '10.0.0.2'),
+                  '2001:db8::1': ('lsp2', '2001:db8::2')},
+            dels=['10.0.0.3', '2001:db8::3'])
+        self.assertEqual({'10.0.0.1': 'lsp1:10.0.0.2',
+                          '[2001:db8::1]': 'lsp2:[2001:db8::2]'},
+                         cmd.adds)
+        self.assertEqual(['10.0.0.3', '[2001:db8::3]'], cmd.dels)
+
 
 class TestOvnSbIdlForLb(base.BaseTestCase):
 
@@ -69,7 +358,8 @@ class TestOvnSbIdlForLb(base.BaseTestCase):
                        create=True)
     def test_start_reuses_connection(self):
         with mock.patch('ovsdbapp.backend.ovs_idl.connection.Connection',
-                        side_effect=lambda x, timeout: mock.Mock()):
+                        side_effect=lambda x, timeout: mock.Mock(
+                            **{'idl.tables': {}})):
             idl1 = impl_idl_ovn.OvnSbIdlForLb()
             ret1 = idl1.start()
             id1 = id(ret1.ovsdb_connection)
@@ -81,6 +371,7 @@ class TestOvnSbIdlForLb(base.BaseTestCase):
     @mock.patch('ovsdbapp.backend.ovs_idl.connection.Connection')
     def test_stop(self, mock_conn):
         mock_conn.stop.return_value = False
+        mock_conn.return_value.idl.tables = {}
         with (
             mock.patch.object(
                 self.idl.notify_handler, 'shutdown')) as mock_notify, (
@@ -90,6 +381,26 @@ class TestOvnSbIdlForLb(base.BaseTestCase):
         mock_notify.assert_called_once_with()
         mock_close.assert_called_once_with()
 
+    @mock.patch('ovsdbapp.backend.ovs_idl.connection.Connection')
+    def test_stop_does_not_block_on_slow_connection(self, mock_conn):
+        mock_conn.return_value.stop.return_value = False
+        mock_conn.return_value.idl.tables = {}
+        with (
+            mock.patch.object(
+                self.idl.notify_handler, 'shutdown')), (
+                mock.patch.object(self.idl, 'close')), (
+                mock.patch.object(impl_idl_ovn.threading,
+                                  'Thread')) as mock_thread:
+            self.idl.start()
+            self.idl.stop()
+        # The initial stop must use a short timeout; the remaining join
+        # of the connection thread is handed off to a daemon thread.
+        mock_conn.return_value.stop.assert_called_once_with(timeout=1)
+        self.assertEqual(mock_conn.return_value.thread.join,
+                         mock_thread.call_args.kwargs['target'])
+        self.assertTrue(mock_thread.call_args.kwargs['daemon'])
+        mock_thread.return_value.start.assert_called_once_with()
+
     @mock.patch('ovsdbapp.backend.ovs_idl.connection.Connection')
     def test_stop_no_connection(self, mock_conn):
         mock_conn.stop.return_value = False
@@ -295,8 +295,8 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
               "uuid3":  "ONLINE", "uuid4":  "ONLINE"}'
         self.helper._clean_ip_port_mappings(self.ovn_hm_lb, 'pool_1')
         self.helper.ovn_nbdb_api.db_clear.assert_not_called()
-        self.helper.ovn_nbdb_api.lb_del_ip_port_mapping.\
-            assert_called_once_with(self.ovn_hm_lb.uuid, 'address2')
+        self.helper.ovn_nbdb_api.lb_bulk_update_ip_port_mapping.\
+            assert_called_once_with(self.ovn_hm_lb.uuid, dels=['address2'])
 
     def test__clean_ip_port_mappings_one_hm_pools_sharing_members(self):
         self.member_line_pool1 = 'member_uuid1_address1:port1_subnet1, \
@@ -310,11 +310,9 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
               "uuid3":  "NO_MONITOR", "uuid4":  "NO_MONITOR"}'
         self.helper._clean_ip_port_mappings(self.ovn_hm_lb, 'pool_1')
         self.helper.ovn_nbdb_api.db_clear.assert_not_called()
-        self.helper.ovn_nbdb_api.lb_del_ip_port_mapping.\
-            assert_has_calls([mock.call(self.ovn_hm_lb.uuid, 'address1'),
-                              mock.ANY,
-                              mock.call(self.ovn_hm_lb.uuid, 'address2'),
-                              mock.ANY])
+        self.helper.ovn_nbdb_api.lb_bulk_update_ip_port_mapping.\
+            assert_called_once_with(self.ovn_hm_lb.uuid,
+                                    dels=['address1', 'address2'])
 
     def test__clean_ip_port_mappings_two_hm_pools_not_sharing_members(self):
         self.member_line_pool1 = 'member_uuid1_address1:port1_subnet1, \
@@ -328,11 +326,9 @@ class TestOvnProviderHelper(ovn_base.TestOvnOctaviaBase):
               "uuid3":  "ONLINE", "uuid4":  "ONLINE"}'
         self.helper._clean_ip_port_mappings(self.ovn_hm_lb, 'pool_1')
         self.helper.ovn_nbdb_api.db_clear.assert_not_called()
-        self.helper.ovn_nbdb_api.lb_del_ip_port_mapping.\
-            assert_has_calls([mock.call(self.ovn_hm_lb.uuid, 'address1'),
-                              mock.ANY,
-                              mock.call(self.ovn_hm_lb.uuid, 'address2'),
-                              mock.ANY])
+        self.helper.ovn_nbdb_api.lb_bulk_update_ip_port_mapping.\
+            assert_called_once_with(self.ovn_hm_lb.uuid,
+                                    dels=['address1', 'address2'])
 
     def test__update_ip_port_mappings_del_backend_member(self):
         src_ip = '10.22.33.4'